@@ -1,49 +1,297 @@
+import argparse
 import os
 import json
+import mmap
 import shutil
 import sys
 import time
 import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from enum import Enum
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
-def calculate_md5(filepath):
-    hash_md5 = hashlib.md5()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+HASH_ALGORITHM = "blake3" if blake3 is not None else "blake2b"
+
+READ_BUFFER_SIZE = 1 << 21
+SINGLE_SHOT_THRESHOLD = 8 << 20
+PARALLEL_THRESHOLD = 8
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+SMALL_FILE_SIZE = 1 << 20
+SMALL_COPY_WORKERS = 16
+LARGE_COPY_WORKERS = 4
+FULL_RESCAN_INTERVAL = 100
+COPY_BUFFER_SIZE = 1 << 20
+
+SEQUENTIAL_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+
+_read_buffers = threading.local()
+_pending_logs = {}
+_timestamp_cache = (None, "")
+
+
+class DeltaStrategy(Enum):
+    ALWAYS = "always"
+    TRUST_MTIME = "trust-mtime"
+    ALWAYS_REPROCESS = "always-reprocess"
+
+
+def get_read_buffer():
+    buffer = getattr(_read_buffers, "view", None)
+    if buffer is None:
+        buffer = memoryview(bytearray(READ_BUFFER_SIZE))
+        _read_buffers.view = buffer
+    return buffer
+
+
+def new_hasher():
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.blake2b()
+
+
+def json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def advise(fd, advice_name):
+    advice = getattr(os, advice_name, None)
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def open_sequential(filepath):
+    f = os.fdopen(os.open(filepath, SEQUENTIAL_OPEN_FLAGS), "rb", buffering=0)
+    advise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+    return f
+
+
+def hash_in_blocks(f, hasher):
+    buffer = get_read_buffer()
+    while True:
+        n = f.readinto(buffer)
+        if not n:
+            break
+        hasher.update(buffer[:n])
+
+
+def hash_mapped(f, hasher):
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+
+    with mapped:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            try:
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            except OSError:
+                pass
+        hasher.update(mapped)
+    return True
+
+
+def calculate_hash(filepath, drop_cache=False, use_mmap=False):
+    hasher = new_hasher()
     try:
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        with open_sequential(filepath) as f:
+            if os.fstat(f.fileno()).st_size < SINGLE_SHOT_THRESHOLD:
+                hasher.update(f.read())
+            elif not (use_mmap and hash_mapped(f, hasher)):
+                hash_in_blocks(f, hasher)
+            if drop_cache:
+                advise(f.fileno(), "POSIX_FADV_DONTNEED")
+        return hasher.digest()
     except (IOError, OSError) as e:
         print(f"Error: Could not calculate hash for {filepath}: {e}")
         return None
 
 
-def get_directory_contents(path):
+def parallel_map(func, items, max_workers):
+    if len(items) < PARALLEL_THRESHOLD:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+
+def hash_files(paths, drop_cache=False, use_mmap=False):
+    return parallel_map(lambda path: calculate_hash(path, drop_cache, use_mmap), paths, HASH_WORKERS)
+
+
+def hash_missing(infos, drop_cache=False, use_mmap=False):
+    missing = [info for info in infos if info["hash"] is None]
+    hashes = hash_files([info["path"] for info in missing], drop_cache, use_mmap)
+    for info, file_hash in zip(missing, hashes):
+        info["hash"] = file_hash
+
+
+def scan_directory(path, rel_path=""):
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError as e:
+        print(f"Error: Could not scan directory {path}: {e}")
+        return
+
+    if os.name == "posix":
+        entries.sort(key=lambda entry: entry.inode())
+
+    for entry in entries:
+        entry_rel_path = os.path.join(rel_path, entry.name) if rel_path else entry.name
+        yield entry_rel_path, entry
+
+        if entry.is_dir() and not entry.is_symlink():
+            yield from scan_directory(entry.path, entry_rel_path)
+
+
+def get_directory_contents(path, hash_cache=None):
     contents = {}
     if not os.path.exists(path):
         return contents
 
-    for root, dirs, files in os.walk(path):
-        rel_path = os.path.relpath(root, path)
-
-        for d in dirs:
-            dir_rel_path = os.path.join(rel_path, d) if rel_path != "." else d
-            contents[dir_rel_path] = {"type": "dir"}
-
-        for f in files:
-            file_rel_path = os.path.join(rel_path, f) if rel_path != "." else f
-            file_full_path = os.path.join(root, f)
-            contents[file_rel_path] = {
+    for rel_path, entry in scan_directory(path):
+        if entry.is_dir():
+            contents[rel_path] = {"type": "dir", "path": entry.path}
+        elif entry.is_file():
+            st = entry.stat()
+            info = {
                 "type": "file",
-                "hash": calculate_md5(file_full_path)
+                "path": entry.path,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "mode": st.st_mode,
+                "hash": None
             }
+            if hash_cache:
+                cached = hash_cache.get(entry.path)
+                if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                    info["hash"] = cached[2]
+            contents[rel_path] = info
 
     return contents
 
 
+def get_cache_file_path(log_file_path):
+    return os.path.splitext(log_file_path)[0] + ".cache.json"
+
+
+def load_hash_cache(cache_file_path):
+    if not os.path.exists(cache_file_path):
+        return {}
+
+    try:
+        with open(cache_file_path, "rb") as f:
+            data = json_loads(f.read())
+
+        if not isinstance(data, dict):
+            raise ValueError("hash cache is not a JSON object")
+
+        if data.get("algorithm") != HASH_ALGORITHM:
+            return {}
+
+        return {
+            path: (size, mtime_ns, bytes.fromhex(file_hash))
+            for path, (size, mtime_ns, file_hash) in data.get("entries", {}).items()
+        }
+    except (ValueError, TypeError, AttributeError, IOError) as e:
+        print(f"Error: Could not read hash cache: {e}. Starting fresh.")
+        return {}
+
+
+def save_hash_cache(hash_cache, cache_file_path):
+    data = {
+        "algorithm": HASH_ALGORITHM,
+        "entries": {
+            path: (size, mtime_ns, file_hash.hex())
+            for path, (size, mtime_ns, file_hash) in hash_cache.items()
+        }
+    }
+
+    cache_dir = os.path.dirname(cache_file_path)
+    if cache_dir and not os.path.exists(cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+
+    try:
+        with open(cache_file_path, "wb") as f:
+            f.write(json_dumps(data) + b"\n")
+    except Exception as e:
+        print(f"Warning: Could not write hash cache: {e}")
+
+
+def update_hash_cache(hash_cache, *contents_list):
+    hash_cache.clear()
+    for contents in contents_list:
+        for info in contents.values():
+            if info["type"] == "file" and info["hash"] is not None:
+                hash_cache[info["path"]] = (info["size"], info["mtime_ns"], info["hash"])
+
+
+def log_is_json_array(log_file_path):
+    if os.path.exists(log_file_path):
+        with open(log_file_path, "rb") as f:
+            head = f.read(4096).lstrip()
+        if head:
+            return head.startswith(b"[")
+    return not log_file_path.endswith(".jsonl")
+
+
+def append_to_json_array(f, entries):
+    end = f.seek(0, os.SEEK_END)
+    tail_start = f.seek(max(0, end - 4096))
+    tail = f.read()
+
+    close = tail.rfind(b"]")
+    head = tail[:close].rstrip()
+    if close == -1 or tail[close + 1:].strip() or not head.endswith((b"[", b"}")):
+        raise ValueError("log file does not end with a JSON array")
+
+    separator = b"\n" if head.endswith(b"[") else b",\n"
+    f.seek(tail_start + len(head))
+    f.write(separator + b",\n".join(json_dumps(entry) for entry in entries) + b"\n]\n")
+    f.truncate()
+
+
+def current_timestamp():
+    global _timestamp_cache
+
+    now_ns = time.time_ns()
+    sec, micro = divmod(now_ns // 1000, 1_000_000)
+
+    cached_sec, cached_iso = _timestamp_cache
+    if sec != cached_sec:
+        cached_iso = datetime.fromtimestamp(sec).isoformat()
+        _timestamp_cache = (sec, cached_iso)
+
+    return f"{cached_iso}.{micro:06d}"
+
+
 def log_operation(operation, path, log_file_path):
-    timestamp = datetime.now().isoformat()
+    timestamp = current_timestamp()
 
     print(f"[{timestamp}] {operation}: {path}")
 
@@ -53,24 +301,35 @@ def log_operation(operation, path, log_file_path):
         "path": path
     }
 
-    logs = []
-    if os.path.exists(log_file_path):
-        try:
-            with open(log_file_path, "r") as f:
-                logs = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error: Could not read existing log file: {e}. Starting fresh.")
-            logs = []
+    _pending_logs.setdefault(log_file_path, deque()).append(log_entry)
 
-    logs.append(log_entry)
+
+def flush_log(log_file_path):
+    entries = _pending_logs.pop(log_file_path, None)
+    if not entries:
+        return
 
     log_dir = os.path.dirname(log_file_path)
     if log_dir and not os.path.exists(log_dir):
         os.makedirs(log_dir, exist_ok=True)
 
     try:
-        with open(log_file_path, "w") as f:
-            json.dump(logs, f, indent=2)
+        if not log_is_json_array(log_file_path):
+            with open(log_file_path, "ab", buffering=1 << 16) as f:
+                f.writelines(json_dumps(entry) + b"\n" for entry in entries)
+            return
+
+        if os.path.exists(log_file_path) and os.path.getsize(log_file_path):
+            try:
+                with open(log_file_path, "r+b") as f:
+                    append_to_json_array(f, entries)
+                return
+            except ValueError as e:
+                print(f"Error: Could not read existing log file: {e}. Starting fresh.")
+
+        with open(log_file_path, "w+b") as f:
+            f.write(b"[\n]\n")
+            append_to_json_array(f, entries)
     except Exception as e:
         print(f"Warning: Could not write to a log file: {e}")
 
@@ -85,88 +344,235 @@ def create_replica_root(replica_path, log_file_path):
 def sync_directories(source_contents, replica_contents, replica_path, log_file_path):
 
     processed = set()
+    replica_prefix = os.path.join(replica_path, "")
 
     for rel_path, info in source_contents.items():
         if info["type"] == "dir":
-            full_replica_path = os.path.join(replica_path, rel_path)
             if rel_path not in replica_contents:
-                os.makedirs(full_replica_path, exist_ok=True)
+                os.makedirs(replica_prefix + rel_path, exist_ok=True)
                 log_operation("CREATE", rel_path, log_file_path)
             processed.add(rel_path)
     return processed
 
 
-def sync_files(source_contents, replica_contents, source_path, replica_path, log_file_path):
+def copy_file_data(src, dst):
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    size = os.fstat(src_fd).st_size
+    copied = 0
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            pass
+        if copied == size:
+            return
+
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        try:
+            while copied < size:
+                n = os.sendfile(dst_fd, src_fd, copied, size - copied)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            pass
+        if copied == size:
+            return
+
+    os.lseek(src_fd, copied, os.SEEK_SET)
+    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+def copy_file(source_file, replica_file):
+    with open(source_file, "rb", buffering=0) as src, open(replica_file, "wb", buffering=0) as dst:
+        copy_file_data(src, dst)
+    shutil.copystat(source_file, replica_file)
+
+
+def unlink_if_shared(replica_file):
+    try:
+        if os.stat(replica_file).st_nlink > 1:
+            os.remove(replica_file)
+    except FileNotFoundError:
+        pass
+
+
+def copy_files(copies, log_file_path):
+    def copy_one(copy):
+        rel_path, info, replica_file, operation = copy
+        if operation == "UPDATE":
+            unlink_if_shared(replica_file)
+        copy_file(info["path"], replica_file)
+        log_operation(operation, rel_path, log_file_path)
+
+    small_copies = [copy for copy in copies if copy[1]["size"] < SMALL_FILE_SIZE]
+    large_copies = [copy for copy in copies if copy[1]["size"] >= SMALL_FILE_SIZE]
+
+    with ThreadPoolExecutor(max_workers=1) as large_executor:
+        large_done = large_executor.submit(parallel_map, copy_one, large_copies, LARGE_COPY_WORKERS)
+        parallel_map(copy_one, small_copies, SMALL_COPY_WORKERS)
+        large_done.result()
+
+
+def plan_links(copies, source_contents, replica_prefix, use_mmap=False):
+    hash_missing([info for _, info, _, _ in copies if info["size"]], use_mmap=use_mmap)
+
+    copying = {rel_path for rel_path, _, _, _ in copies}
+    seen_to_path = {
+        (info["hash"], info["mode"]): replica_prefix + rel_path
+        for rel_path, info in source_contents.items()
+        if info["type"] == "file" and info.get("hash") is not None and rel_path not in copying
+    }
+
+    unique_copies = []
+    links = []
+    for copy in copies:
+        rel_path, info, replica_file, operation = copy
+        key = (info["hash"], info["mode"]) if info["size"] and info["hash"] is not None else None
+        if key is not None and key in seen_to_path:
+            links.append((rel_path, info, seen_to_path[key], replica_file, operation))
+        else:
+            if key is not None:
+                seen_to_path[key] = replica_file
+            unique_copies.append(copy)
+
+    return unique_copies, links
+
+
+def link_files(links, log_file_path):
+    for rel_path, info, target_file, replica_file, operation in links:
+        try:
+            os.remove(replica_file)
+        except FileNotFoundError:
+            pass
+
+        try:
+            os.link(target_file, replica_file)
+            log_operation("LINK", rel_path, log_file_path)
+        except OSError:
+            copy_file(info["path"], replica_file)
+            log_operation(operation, rel_path, log_file_path)
+
+
+def file_changed(source_info, replica_info, strategy):
+    if strategy is DeltaStrategy.ALWAYS_REPROCESS:
+        return True
+
+    if source_info["size"] != replica_info["size"]:
+        return True
+
+    if strategy is DeltaStrategy.TRUST_MTIME and source_info["mtime_ns"] == replica_info["mtime_ns"]:
+        return False
+
+    return None
+
+
+def sync_files(source_contents, replica_contents, replica_path, log_file_path, strategy=DeltaStrategy.TRUST_MTIME,
+               hardlink_duplicates=False, use_mmap=False):
     processed = set()
+    copies = []
+    to_compare = []
+    replica_prefix = os.path.join(replica_path, "")
 
     for rel_path, info in source_contents.items():
         if info["type"] == "file":
-            source_file = os.path.join(source_path, rel_path)
-            replica_file = os.path.join(replica_path, rel_path)
-
-            needs_copy = False
-            operation = "COPY"
+            replica_file = replica_prefix + rel_path
 
             if rel_path not in replica_contents:
-                needs_copy = True
-                operation = "COPY"
-            elif replica_contents[rel_path]["hash"] != info["hash"]:
-                needs_copy = True
-                operation = "UPDATE"
+                copies.append((rel_path, info, replica_file, "COPY"))
+            else:
+                replica_info = replica_contents[rel_path]
+                changed = file_changed(info, replica_info, strategy)
+                if changed is None:
+                    to_compare.append((rel_path, info, replica_info))
+                elif changed:
+                    copies.append((rel_path, info, replica_file, "UPDATE"))
 
-            if needs_copy:
-                parent_dir = os.path.dirname(replica_file)
-                if parent_dir and not os.path.exists(parent_dir):
-                    os.makedirs(parent_dir, exist_ok=True)
+            processed.add(rel_path)
 
-                shutil.copy2(source_file, replica_file)
-                log_operation(operation, rel_path, log_file_path)
+    hash_missing([source_info for _, source_info, _ in to_compare], use_mmap=use_mmap)
+    hash_missing([replica_info for _, _, replica_info in to_compare], drop_cache=True, use_mmap=use_mmap)
 
-            processed.add(rel_path)
+    for rel_path, info, replica_info in to_compare:
+        if info["hash"] != replica_info["hash"]:
+            copies.append((rel_path, info, replica_prefix + rel_path, "UPDATE"))
+
+    links = []
+    if hardlink_duplicates:
+        copies, links = plan_links(copies, source_contents, replica_prefix, use_mmap)
+
+    copy_files(copies, log_file_path)
+    link_files(links, log_file_path)
+
+    written = {copy[0] for copy in copies} | {link[0] for link in links}
+    for rel_path in written & replica_contents.keys():
+        replica_contents[rel_path]["hash"] = None
 
     return processed
 
 
-def remove_item(replica_contents, replica_path, processed, log_file_path):
+def remove_item(replica_contents, processed, log_file_path):
+
+    removed_dir_prefix = None
 
     for rel_path, info in replica_contents.items():
-        if rel_path not in processed:
-            full_replica_path = os.path.join(replica_path, rel_path)
+        if rel_path in processed:
+            continue
 
-            if info["type"] == "file":
-                if os.path.exists(full_replica_path):
-                    os.remove(full_replica_path)
-                    log_operation("REMOVE", rel_path, log_file_path)
-            elif info["type"] == "dir":
-                if os.path.exists(full_replica_path):
-                    try:
-                        shutil.rmtree(full_replica_path)
-                        log_operation("REMOVE", rel_path, log_file_path)
-                    except (OSError, shutil.Error) as e:
-                        print(f"Error: Could not remove directory {rel_path}: {e}")
+        if removed_dir_prefix and rel_path.startswith(removed_dir_prefix):
+            continue
 
+        if info["type"] == "file":
+            try:
+                os.remove(info["path"])
+                log_operation("REMOVE", rel_path, log_file_path)
+            except OSError as e:
+                print(f"Error: Could not remove file {rel_path}: {e}")
+        elif info["type"] == "dir":
+            removed_dir_prefix = rel_path + os.sep
+            try:
+                shutil.rmtree(info["path"])
+                log_operation("REMOVE", rel_path, log_file_path)
+            except (OSError, shutil.Error) as e:
+                print(f"Error: Could not remove directory {rel_path}: {e}")
+
+
+def synchronize(source_path, replica_path, log_file_path, strategy=DeltaStrategy.TRUST_MTIME, hash_cache=None,
+                hardlink_duplicates=False, use_mmap=False):
 
-def synchronize(source_path, replica_path, log_file_path):
+    try:
+        lookup_cache = None if strategy is DeltaStrategy.ALWAYS else hash_cache
+        source_contents = get_directory_contents(source_path, lookup_cache)
+        replica_contents = get_directory_contents(replica_path, lookup_cache)
 
-    source_contents = get_directory_contents(source_path)
-    replica_contents = get_directory_contents(replica_path)
+        create_replica_root(replica_path, log_file_path)
 
-    create_replica_root(replica_path, log_file_path)
+        processed = set()
 
-    processed = set()
+        processed.update(
+            sync_directories(source_contents, replica_contents, replica_path, log_file_path)
+        )
 
-    processed.update(
-        sync_directories(source_contents, replica_contents, replica_path, log_file_path)
-    )
+        processed.update(
+            sync_files(source_contents, replica_contents, replica_path, log_file_path, strategy, hardlink_duplicates,
+                       use_mmap)
+        )
 
-    processed.update(
-        sync_files(source_contents, replica_contents, source_path, replica_path, log_file_path)
-    )
+        remove_item(replica_contents, processed, log_file_path)
+    finally:
+        flush_log(log_file_path)
 
-    remove_item(replica_contents, replica_path, processed, log_file_path)
+    if hash_cache is not None:
+        update_hash_cache(hash_cache, source_contents, replica_contents)
 
 
-def main(source_path, replica_path, interval, amount, log_file_path):
+def main(source_path, replica_path, interval, amount, log_file_path, strategy=DeltaStrategy.TRUST_MTIME,
+         hardlink_duplicates=False, use_mmap=False):
 
     try:
         interval = int(interval)
@@ -179,16 +585,28 @@ def main(source_path, replica_path, interval, amount, log_file_path):
         print(f"Error: Source path does not exist: {source_path}")
         return
 
+    cache_file_path = get_cache_file_path(log_file_path)
+    hash_cache = load_hash_cache(cache_file_path)
+
     for iteration in range(amount):
 
         print(f"\nSynchronization: {iteration + 1}/{amount}")
 
+        pass_strategy = strategy
+        if iteration % FULL_RESCAN_INTERVAL == FULL_RESCAN_INTERVAL - 1:
+            hash_cache.clear()
+            if strategy is DeltaStrategy.TRUST_MTIME:
+                pass_strategy = DeltaStrategy.ALWAYS
+
         try:
-            synchronize(source_path, replica_path, log_file_path)
+            synchronize(source_path, replica_path, log_file_path, pass_strategy, hash_cache, hardlink_duplicates,
+                        use_mmap)
         except Exception as e:
             print(f"Error during synchronization: {e}")
             return
 
+        save_hash_cache(hash_cache, cache_file_path)
+
         if iteration < amount - 1:
             print(f"Waiting {interval} seconds until next sync...")
             time.sleep(interval)
@@ -198,10 +616,31 @@ def main(source_path, replica_path, interval, amount, log_file_path):
 
 
 if __name__ == "__main__":
-    args = sys.argv
+    parser = argparse.ArgumentParser(description="Synchronize a replica folder with a source folder.")
+    parser.add_argument("source_path", help="path to source folder")
+    parser.add_argument("replica_path", help="path to replica folder")
+    parser.add_argument("interval", help="interval between synchronizations in seconds")
+    parser.add_argument("amount", help="amount of synchronizations")
+    parser.add_argument("log_file_path", help="path to log file")
+    parser.add_argument(
+        "--strategy",
+        choices=[strategy.value for strategy in DeltaStrategy],
+        default=DeltaStrategy.TRUST_MTIME.value,
+        help="how to detect changed files: compare size and modification time first (trust-mtime, default), "
+             "always compare content hashes (always) or copy every file on each pass (always-reprocess)"
+    )
+    parser.add_argument(
+        "--hardlink-duplicates",
+        action="store_true",
+        help="hard-link files with identical content in the replica instead of copying each of them"
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="hash files of 8 MiB or more through mmap; faster, but the process is killed if such a file "
+             "is truncated while it is being hashed"
+    )
+    args = parser.parse_args()
 
-    if len(args) != 6:
-        raise Exception("You must pass 5 arguments: path to source folder, path to replica folder, interval between synchronizations in seconds,  amount of synchronizations,  path to log file.")
-    else:
-        source_path, replica_path, interval, amount, log_file_path = args[1:]
-        main(source_path, replica_path, interval, amount, log_file_path)
+    main(args.source_path, args.replica_path, args.interval, args.amount, args.log_file_path,
+         DeltaStrategy(args.strategy), args.hardlink_duplicates, args.mmap)